@@ -3,7 +3,7 @@
 
 import json
 from pathlib import Path
-from typing import Any, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from ruamel.yaml import YAML
 
@@ -14,7 +14,8 @@ yaml.preserve_quotes = True
 class BasicConfig(dict):
     """
     Basic configuration class for loading and saving JSON/YAML files with auto-saving.
-    Be careful, changing the mutable value will not be saved automatically.
+    Be careful, changing the mutable value will not be saved automatically,
+    and will not be seen by ``get_keys`` until the next ``save``.
     """
 
     def __init__(
@@ -24,6 +25,12 @@ class BasicConfig(dict):
         yaml_format: bool = False,
     ) -> None:
         super().__init__()
+        # Bumped on every save so callers can cheaply detect config changes
+        self.version = 0
+        # Flattened key path -> value index used by get_keys, rebuilt lazily
+        # whenever ``version`` changes
+        self._flat: Dict[Tuple[Any, ...], Any] = {}
+        self._flat_version: Optional[int] = None
         self.yaml_format = yaml_format
         self.path = Path(path).with_suffix(".yml" if yaml_format else ".json")
         self.default_content = default_content or {}
@@ -37,9 +44,11 @@ class BasicConfig(dict):
         else:
             self.update(self.default_content)
             self.save()
+        self.version += 1
 
     def save(self) -> None:
         """Save data to file."""
+        self.version += 1
         self.path.parent.mkdir(parents=True, exist_ok=True)
         with self.path.open("w", encoding="UTF-8") as f:
             if self.yaml_format:
@@ -55,10 +64,55 @@ class BasicConfig(dict):
         super().__delitem__(key)
         self.save()
 
+    # Top-level mutations that do not save still invalidate the get_keys index
+    def update(self, *args, **kwargs) -> None:
+        super().update(*args, **kwargs)
+        self._flat_version = None
+
+    def clear(self) -> None:
+        super().clear()
+        self._flat_version = None
+
+    def pop(self, *args):
+        result = super().pop(*args)
+        self._flat_version = None
+        return result
+
+    def popitem(self):
+        result = super().popitem()
+        self._flat_version = None
+        return result
+
+    def setdefault(self, key, default=None):
+        result = super().setdefault(key, default)
+        self._flat_version = None
+        return result
+
+    def _build_flat(self) -> None:
+        """Index every key path (including intermediate dicts) for get_keys."""
+        flat: Dict[Tuple[Any, ...], Any] = {}
+
+        def _walk(node: dict, path: Tuple[Any, ...]) -> None:
+            for k, v in node.items():
+                sub_path = path + (k,)
+                flat[sub_path] = v
+                if isinstance(v, dict):
+                    _walk(v, sub_path)
+
+        _walk(self, ())
+        self._flat = flat
+        self._flat_version = self.version
+
     def get_keys(self, key: List[str], default: Optional[Any] = None) -> Any:
         """
         Get value from config by key path.
 
+        Values are served from an index of every key path, rebuilt after
+        ``load``/``save`` and after top-level dict mutations.  Nested values
+        changed in place (e.g. ``config["a"]["b"] = 1``) are NOT seen until
+        ``save()`` is called.  A path running through a non-dict value
+        returns ``default``.
+
         Parameters
         ----------
         key : List[str]
@@ -79,7 +133,6 @@ class BasicConfig(dict):
         >>> config.get_keys(["key", "not", "exists"], [123, 321])
         [123, 321]
         """
-        result = self
-        for k in key[:-1]:
-            result = result.get(k, {})
-        return result.get(key[-1], default)
+        if self._flat_version != self.version:
+            self._build_flat()
+        return self._flat.get(tuple(key), default)
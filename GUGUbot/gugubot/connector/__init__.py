@@ -1,6 +1,6 @@
 from gugubot.connector.basic_connector import BasicConnector
 from gugubot.connector.bridge_connector import BridgeConnector
-from gugubot.connector.connector_manager import ConnectorManager
+from gugubot.connector.connector_manager import BroadcastBatcher, ConnectorManager
 from gugubot.connector.mc_connector import MCConnector
 from gugubot.connector.qq_connector import QQWebSocketConnector
 from gugubot.connector.test_connector import TestConnector
@@ -8,6 +8,7 @@ from gugubot.connector.test_connector import TestConnector
 __all__ = [
     "BasicConnector",
     "BridgeConnector",
+    "BroadcastBatcher",
     "ConnectorManager",
     "MCConnector",
     "QQWebSocketConnector",
@@ -1,7 +1,7 @@
 """Abstract base connector class."""
 
 from abc import ABC, abstractmethod
-from typing import Any, Optional
+from typing import Any, List, Optional
 
 from gugubot.config import BotConfig
 from gugubot.parser.basic_parser import BasicParser
@@ -88,6 +88,21 @@ class BasicConnector(ABC):
         """
         raise NotImplementedError
 
+    async def send_many(self, processed_infos: List[ProcessedInfo]) -> None:
+        """Send several messages through the connector.
+
+        Used by ``ConnectorManager`` when flushing a batch.  The default
+        implementation sends the messages one by one, in order; connectors
+        whose backend supports a batched write may override it.
+
+        Parameters
+        ----------
+        processed_infos : list[ProcessedInfo]
+            The messages to be sent.
+        """
+        for processed_info in processed_infos:
+            await self.send_message(processed_info)
+
     @abstractmethod
     async def on_message(self, raw: Any) -> None:
         """Handle a raw incoming message.
@@ -6,13 +6,107 @@ Provides registration, removal, and message broadcasting across connectors.
 import asyncio
 import logging
 import re
+import threading
 import traceback
-from typing import Dict, List, Optional
+import weakref
+from contextvars import ContextVar
+from typing import Dict, List, Optional, Tuple
 
 from gugubot.config import BotConfig
 from gugubot.connector.basic_connector import BasicConnector
 from gugubot.utils.types import ProcessedInfo
 
+# Maximum number of in-flight sends to a single connector
+MAX_CONCURRENT_SENDS = 8
+
+# Batcher of the event currently being processed by the running task (if any)
+_current_batcher: ContextVar[Optional["BroadcastBatcher"]] = ContextVar(
+    "gugubot_broadcast_batcher", default=None
+)
+
+
+class BroadcastBatcher:
+    """Collect outbound messages produced while handling one incoming event.
+
+    Used as an async context manager (see :meth:`ConnectorManager.batch`).
+    Messages queued through :meth:`ConnectorManager.queue_processed_info`
+    inside the context are grouped by target connector and dispatched
+    together on exit, one :meth:`BasicConnector.send_many` call per
+    connector.  Nested contexts share the outermost batcher.
+
+    Tasks scheduled while the context is active copy it and may still see
+    the batcher after it has been flushed; such a batcher is marked
+    ``closed`` and further messages bypass it.
+
+    Attributes
+    ----------
+    connector_manager : ConnectorManager
+        The manager used to dispatch the collected messages.
+    closed : bool
+        Whether the batcher has been flushed and no longer accepts messages.
+    """
+
+    def __init__(self, connector_manager: "ConnectorManager") -> None:
+        self.connector_manager = connector_manager
+        self.closed = False
+        self._pending: Dict[BasicConnector, List[ProcessedInfo]] = {}
+        self._token = None
+
+    async def __aenter__(self) -> "BroadcastBatcher":
+        outer = _current_batcher.get()
+        if outer is not None:
+            return outer
+        self._token = _current_batcher.set(self)
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> bool:
+        if self._token is None:
+            return False
+        _current_batcher.reset(self._token)
+        self._token = None
+        self.closed = True
+        await self.flush()
+        return False
+
+    def add(self, connector: BasicConnector, processed_info: ProcessedInfo) -> None:
+        """Queue a message for a single connector, keeping per-connector order.
+
+        Raises
+        ------
+        RuntimeError
+            If the batcher is already closed.
+        """
+        if self.closed:
+            raise RuntimeError("BroadcastBatcher 已关闭，无法再添加消息")
+        self._pending.setdefault(connector, []).append(processed_info)
+
+    async def flush(self) -> Dict[str, Exception]:
+        """Dispatch every queued message and close the batcher.
+
+        Returns
+        -------
+        dict[str, Exception]
+            A mapping of connector source to the exception raised during
+            sending, for every connector that failed.
+        """
+        self.closed = True
+        pending, self._pending = self._pending, {}
+        if not pending:
+            return {}
+
+        results = await asyncio.gather(
+            *(
+                self.connector_manager._safe_send_many(connector, infos)
+                for connector, infos in pending.items()
+            ),
+            return_exceptions=True,
+        )
+        return {
+            connector.source: result
+            for connector, result in zip(pending, results)
+            if isinstance(result, Exception)
+        }
+
 
 class ConnectorManager:
     """Manage multiple connector instances.
@@ -50,6 +144,31 @@ class ConnectorManager:
 
         self.system_manager = None  # gugubot.logic.system.system_manager.SystemManager
 
+        # Bumped whenever the connector set (or a connector's enable flags)
+        # changes; derived lookups below are rebuilt lazily on mismatch.
+        self._version = 0
+        self._cache_version = -1
+        self._connector_map: Dict[str, BasicConnector] = {}
+        self._disabled_receive_sources: Tuple[str, ...] = ()
+
+        # Bounds the number of in-flight sends per connector.  asyncio
+        # primitives are bound to one event loop, and the bridge connector
+        # drives this manager from its own threads/loops, so keep a separate
+        # set of semaphores per loop (dropped together with the loop).
+        # event loop -> {connector source: semaphore}
+        self._send_semaphores = weakref.WeakKeyDictionary()
+        self._send_semaphores_lock = threading.Lock()
+
+    def batch(self) -> BroadcastBatcher:
+        """Create a batcher for the outbound messages of one incoming event.
+
+        Returns
+        -------
+        BroadcastBatcher
+            Async context manager; queued messages are sent on exit.
+        """
+        return BroadcastBatcher(self)
+
     def register_system_manager(self, system_manager) -> None:
         """Register the system manager instance.
 
@@ -60,6 +179,39 @@ class ConnectorManager:
         """
         self.system_manager = system_manager
 
+    @property
+    def version(self) -> int:
+        """Monotonic counter bumped on every connector change."""
+        return self._version
+
+    def invalidate_cache(self) -> None:
+        """Mark derived connector lookups as stale.
+
+        Call this after toggling ``enable``/``enable_receive``/``enable_send``
+        on a registered connector.
+        """
+        self._version += 1
+
+    def _ensure_cache(self) -> None:
+        """Rebuild derived connector lookups if the connector set changed."""
+        if self._cache_version == self._version:
+            return
+        connector_map: Dict[str, BasicConnector] = {}
+        for connector in self.connectors:
+            # Keep the first match to mirror the previous linear scan
+            connector_map.setdefault(connector.source, connector)
+        self._connector_map = connector_map
+        self._disabled_receive_sources = tuple(
+            c.source for c in self.connectors if not c.enable_receive
+        )
+        self._cache_version = self._version
+
+    @property
+    def disabled_receive_sources(self) -> Tuple[str, ...]:
+        """Sources of every connector with ``enable_receive`` turned off."""
+        self._ensure_cache()
+        return self._disabled_receive_sources
+
     def get_connector(self, source: str) -> Optional[BasicConnector]:
         """Look up a connector by its source identifier.
 
@@ -73,10 +225,8 @@ class ConnectorManager:
         BasicConnector or None
             The matching connector, or ``None`` if not found.
         """
-        for connector in self.connectors:
-            if connector.source == source:
-                return connector
-        return None
+        self._ensure_cache()
+        return self._connector_map.get(source)
 
     async def register_connector(self, connector: BasicConnector) -> None:
         """Register and connect a new connector.
@@ -101,6 +251,7 @@ class ConnectorManager:
 
             await connector.connect()
             self.connectors.append(connector)
+            self.invalidate_cache()
 
             self.logger.info(f"已添加并连接到连接器: {connector.source}")
         except Exception as e:
@@ -130,12 +281,14 @@ class ConnectorManager:
         try:
             await connector.disconnect()
             self.connectors.remove(connector)
+            self.invalidate_cache()
             self.logger.info(f"已断开并移除连接器: {connector.source}")
         except Exception as e:
             error_msg = str(e) + "\n" + traceback.format_exc()
             self.logger.error(f"断开 {connector.source} 失败: {error_msg}")
             # Still remove from the list even if disconnect failed
             self.connectors.remove(connector)
+            self.invalidate_cache()
             raise
 
     async def broadcast_processed_info(
@@ -163,8 +316,69 @@ class ConnectorManager:
             A mapping of connector source to the exception raised during
             sending, for every connector that failed.
         """
-        failures: Dict[str, Exception] = {}
-        tasks = []
+        to_connectors = self._filter_connectors(include, exclude)
+
+        connector_info = f"广播消息到连接器: {to_connectors}"
+        message_info = f"消息内容: {processed_info}"
+        debug_msg = connector_info + "\n" + message_info
+        self.logger.debug(debug_msg)
+
+        # Send concurrently so one slow connector doesn't delay the others;
+        # errors are already logged per connector in _safe_send.
+        results = await asyncio.gather(
+            *(self._safe_send(c, processed_info) for c in to_connectors),
+            return_exceptions=True,
+        )
+
+        return {
+            connector.source: result
+            for connector, result in zip(to_connectors, results)
+            if isinstance(result, Exception)
+        }
+
+    async def queue_processed_info(
+        self,
+        processed_info: ProcessedInfo,
+        include: Optional[List[str]] = None,
+        exclude: Optional[List[str]] = None,
+    ) -> Dict[str, Exception]:
+        """Queue a message on the current event's batcher.
+
+        Falls back to :meth:`broadcast_processed_info` when no batcher is
+        active in the running task, or when the batcher inherited by a
+        scheduled task has already been flushed.
+
+        Parameters
+        ----------
+        processed_info : ProcessedInfo
+            The processed message to broadcast.
+        include : list[str] or None, optional
+            Same as in :meth:`broadcast_processed_info`.
+        exclude : list[str] or None, optional
+            Same as in :meth:`broadcast_processed_info`.
+
+        Returns
+        -------
+        dict[str, Exception]
+            Send failures; always empty when the message was queued, since
+            failures are only known once the batch is flushed.
+        """
+        batcher = _current_batcher.get()
+        if batcher is None or batcher.closed:
+            return await self.broadcast_processed_info(
+                processed_info, include=include, exclude=exclude
+            )
+
+        for connector in self._filter_connectors(include, exclude):
+            batcher.add(connector, processed_info)
+        return {}
+
+    def _filter_connectors(
+        self,
+        include: Optional[List[str]] = None,
+        exclude: Optional[List[str]] = None,
+    ) -> List[BasicConnector]:
+        """Select the connectors matching the include/exclude patterns."""
         to_connectors = self.connectors
 
         # Use re.escape for literal matching so special chars in source names
@@ -183,22 +397,25 @@ class ConnectorManager:
                 if not any(re.match(re.escape(p), c.source) for p in exclude)
             ]
 
-        connector_info = f"广播消息到连接器: {to_connectors}"
-        message_info = f"消息内容: {processed_info}"
-        debug_msg = connector_info + "\n" + message_info
-        self.logger.debug(debug_msg)
-
-        for connector in to_connectors:
-            task = asyncio.create_task(self._safe_send(connector, processed_info))
-            tasks.append((connector, task))
+        return to_connectors
 
-        for connector, task in tasks:
-            try:
-                await task
-            except Exception as e:
-                failures[connector.source] = e
+    def _get_send_semaphore(self, connector: BasicConnector) -> asyncio.Semaphore:
+        """Return the semaphore limiting concurrent sends to *connector*.
 
-        return failures
+        Semaphores are scoped to the running event loop, so callers on
+        different loops never wait on each other's primitives.
+        """
+        loop = asyncio.get_running_loop()
+        with self._send_semaphores_lock:
+            loop_semaphores = self._send_semaphores.get(loop)
+            if loop_semaphores is None:
+                loop_semaphores = self._send_semaphores[loop] = {}
+            semaphore = loop_semaphores.get(connector.source)
+            if semaphore is None:
+                semaphore = loop_semaphores[connector.source] = asyncio.Semaphore(
+                    MAX_CONCURRENT_SENDS
+                )
+        return semaphore
 
     async def _safe_send(
         self, connector: BasicConnector, processed_info: ProcessedInfo
@@ -218,7 +435,33 @@ class ConnectorManager:
             Re-raised after logging if the send fails.
         """
         try:
-            await connector.send_message(processed_info)
+            async with self._get_send_semaphore(connector):
+                await connector.send_message(processed_info)
+        except Exception as e:
+            error_msg = str(e) + "\n" + traceback.format_exc()
+            self.logger.error(f"发送消息到 {connector.source} 失败: {error_msg}")
+            raise
+
+    async def _safe_send_many(
+        self, connector: BasicConnector, processed_infos: List[ProcessedInfo]
+    ) -> None:
+        """Send a batch of messages to a single connector, logging errors.
+
+        Parameters
+        ----------
+        connector : BasicConnector
+            Target connector.
+        processed_infos : list[ProcessedInfo]
+            The processed messages to send, in order.
+
+        Raises
+        ------
+        Exception
+            Re-raised after logging if the send fails.
+        """
+        try:
+            async with self._get_send_semaphore(connector):
+                await connector.send_many(processed_infos)
         except Exception as e:
             error_msg = str(e) + "\n" + traceback.format_exc()
             self.logger.error(f"发送消息到 {connector.source} 失败: {error_msg}")
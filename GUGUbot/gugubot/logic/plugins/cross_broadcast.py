@@ -5,10 +5,11 @@
 在 MC 端发送 !!qq <消息> 可将消息仅广播到 QQ。
 """
 
-import copy
+from dataclasses import replace
+from typing import List
 
 from gugubot.logic.system.basic_system import BasicSystem
-from gugubot.utils.types import BroadcastInfo, ProcessedInfo
+from gugubot.utils.types import BroadcastInfo
 
 
 class CrossBroadcastSystem(BasicSystem):
@@ -24,91 +25,77 @@ class CrossBroadcastSystem(BasicSystem):
     def initialize(self) -> None:
         return
 
+    def invalidate_config_cache(self) -> None:
+        """额外缓存来源名称与跨平台命令。"""
+        super().invalidate_config_cache()
+        if self.config is None:
+            return
+        self._qq_source = self.config.get_keys(["connector", "QQ", "source_name"], "QQ")
+        self._mc_source = self.config.get_keys(["connector", "minecraft", "source_name"], "Minecraft")
+        mc_cmd = self.config.get_keys(["system", "cross_broadcast", "mc_command"], "mc")
+        self._mc_prefix = self._command_prefix + mc_cmd
+        self._qq_cmd = self.config.get_keys(["system", "cross_broadcast", "qq_command"], "!!qq")
+
+    def register_prefixes(self) -> List[str]:
+        self._ensure_config_cache()
+        return [self._mc_prefix, self._qq_cmd]
+
     async def process_broadcast_info(self, broadcast_info: BroadcastInfo) -> bool:
         if broadcast_info.event_type != "message":
             return False
-        if not broadcast_info.message or broadcast_info.message[0].get("type") != "text":
-            return False
         if not self.enable:
             return False
 
-        text = (broadcast_info.message[0].get("data") or {}).get("text", "").strip()
+        text = broadcast_info.first_text
+        if not text:
+            return False
+
+        self._ensure_config_cache()
         source_name = broadcast_info.receiver_source or broadcast_info.source.origin
 
         # QQ 端: #mc <消息> -> 仅广播到 MC
-        qq_source = self.config.get_keys(["connector", "QQ", "source_name"], "QQ")
-        mc_source = self.config.get_keys(["connector", "minecraft", "source_name"], "Minecraft")
-        command_prefix = self.config.get("GUGUBot", {}).get("command_prefix", "#")
-        mc_cmd = self.config.get_keys(["system", "cross_broadcast", "mc_command"], "mc")
-
-        if source_name == qq_source and text.startswith(command_prefix + mc_cmd):
-            remaining = self._strip_command(broadcast_info.message, command_prefix + mc_cmd)
-            return await self._broadcast_to_mc(broadcast_info, remaining)
+        if source_name == self._qq_source and text.startswith(self._mc_prefix):
+            remaining = self._strip_command(broadcast_info.message, self._mc_prefix)
+            return await self._broadcast_to(broadcast_info, remaining, self._mc_source)
 
         # MC 端: !!qq <消息> -> 仅广播到 QQ
-        qq_cmd = self.config.get_keys(["system", "cross_broadcast", "qq_command"], "!!qq")
-        if source_name == mc_source and text.startswith(qq_cmd):
-            remaining = self._strip_command(broadcast_info.message, qq_cmd)
-            return await self._broadcast_to_qq(broadcast_info, remaining)
+        if source_name == self._mc_source and text.startswith(self._qq_cmd):
+            remaining = self._strip_command(broadcast_info.message, self._qq_cmd)
+            return await self._broadcast_to(broadcast_info, remaining, self._qq_source)
 
         return False
 
     @staticmethod
     def _strip_command(message: list, command: str) -> list:
         """从消息段列表的第一个文本段中移除命令前缀，返回剩余的完整消息段列表。"""
-        result = copy.deepcopy(message)
-        first_text = (result[0].get("data") or {}).get("text", "")
-        remaining_text = first_text[len(command):].strip()
+        # 只改写第一个文本段，其余消息段直接共享引用，无需深拷贝
+        result = list(message)
+        first = result[0]
+        first_data = first.get("data") or {}
+        remaining_text = first_data.get("text", "")[len(command):].strip()
         if remaining_text:
-            result[0] = {**result[0], "data": {**result[0].get("data", {}), "text": remaining_text}}
+            result[0] = {**first, "data": {**first_data, "text": remaining_text}}
         else:
-            result.pop(0)
+            result = result[1:]
         if not result:
             result = [{"type": "text", "data": {"text": " "}}]
         return result
 
-    async def _broadcast_to_mc(
-            self, broadcast_info: BroadcastInfo, message: list
-    ) -> bool:
-        mc_source = self.config.get_keys(["connector", "minecraft", "source_name"], "Minecraft")
-        connector = self.system_manager.connector_manager.get_connector(mc_source)
-        if not connector or not connector.enable:
-            return False
-        processed_info = ProcessedInfo(
-            processed_message=message,
-            _source=broadcast_info.source,
-            source_id=broadcast_info.source_id,
-            sender=broadcast_info.sender,
-            raw=broadcast_info.raw,
-            server=broadcast_info.server,
-            logger=broadcast_info.logger,
-            event_sub_type=broadcast_info.event_sub_type,
-            sender_id=broadcast_info.sender_id,
-        )
-        await self.system_manager.connector_manager.broadcast_processed_info(
-            processed_info, include=[mc_source]
-        )
-        return True
-
-    async def _broadcast_to_qq(
-            self, broadcast_info: BroadcastInfo, message: list
+    async def _broadcast_to(
+            self, broadcast_info: BroadcastInfo, message: list, source_name: str
     ) -> bool:
-        qq_source = self.config.get_keys(["connector", "QQ", "source_name"], "QQ")
-        connector = self.system_manager.connector_manager.get_connector(qq_source)
+        """将消息仅广播到指定来源的连接器。"""
+        connector = self.system_manager.connector_manager.get_connector(source_name)
         if not connector or not connector.enable:
             return False
-        processed_info = ProcessedInfo(
+        # 强制广播不携带原消息的接收者与目标，由目标连接器按默认规则发送
+        processed_info = replace(
+            self.create_processed_info(broadcast_info),
             processed_message=message,
-            _source=broadcast_info.source,
-            source_id=broadcast_info.source_id,
-            sender=broadcast_info.sender,
-            raw=broadcast_info.raw,
-            server=broadcast_info.server,
-            logger=broadcast_info.logger,
-            event_sub_type=broadcast_info.event_sub_type,
-            sender_id=broadcast_info.sender_id,
+            receiver=None,
+            target=None,
         )
-        await self.system_manager.connector_manager.broadcast_processed_info(
-            processed_info, include=[qq_source]
+        await self.system_manager.connector_manager.queue_processed_info(
+            processed_info, include=[source_name]
         )
         return True
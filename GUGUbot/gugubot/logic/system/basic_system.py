@@ -1,5 +1,5 @@
 import logging
-from typing import List, Optional, TYPE_CHECKING
+from typing import FrozenSet, List, Optional, TYPE_CHECKING
 
 from gugubot.builder import MessageBuilder
 from gugubot.config import BotConfig
@@ -40,10 +40,14 @@ class BasicSystem:
         self.system_manager: Optional[SystemManager] = None
         self.logger: Optional[logging.Logger] = None
         self.config: Optional[BotConfig] = config
+        self._cfg_version: Optional[int] = None
+        self._admin_group_ids_set: FrozenSet[str] = frozenset()
+        self._bridge_name: Optional[str] = None
 
         # 从配置读取enable状态，如果没有配置则使用传入的enable参数
         if config:
             self.enable = config.get_keys(["system", name, "enable"], enable)
+            self.invalidate_config_cache()
         else:
             self.enable = enable
 
@@ -55,6 +59,46 @@ class BasicSystem:
         """
         pass
 
+    def invalidate_config_cache(self) -> None:
+        """重新读取缓存的配置项。
+
+        每条消息都会用到的配置项（命令前缀等）缓存在实例上，
+        配置保存后（版本号变化）会在下次使用时自动刷新。
+        子类可以重写此方法以缓存更多配置项，但需要调用父类方法。
+        """
+        self._bridge_name = None
+        if self.config is None:
+            return
+        self._command_prefix = self.config.get_keys(["GUGUBot", "command_prefix"], "#")
+        self._group_admin = self.config.get_keys(["GUGUBot", "group_admin"], False)
+        self._admin_group_ids_set: FrozenSet[str] = frozenset(
+            str(i)
+            for i in self.config.get_keys(
+                ["connector", "QQ", "permissions", "admin_group_ids"], []
+            ) or []
+            if i
+        )
+        self._cfg_version = self.config.version
+
+    def _ensure_config_cache(self) -> None:
+        """配置版本变化时刷新缓存。"""
+        if self._cfg_version != self.config.version:
+            self.invalidate_config_cache()
+
+    def register_prefixes(self) -> Optional[List[str]]:
+        """声明本系统只处理以哪些前缀开头的文本消息。
+
+        返回前缀列表时，系统管理器会在消息文本不以其中任何一个前缀开头时
+        跳过本系统；返回 None（默认）表示本系统需要处理所有消息。
+        配置保存后会重新调用本方法。
+
+        Returns
+        -------
+        Optional[List[str]]
+            前缀列表，或 None
+        """
+        return None
+
     async def process_broadcast_info(self, broadcast_info: BroadcastInfo) -> bool:
         """处理接收到的命令。
 
@@ -88,22 +132,17 @@ class BasicSystem:
         if broadcast_info.event_type != "message":
             return False
 
-        message = broadcast_info.message
-        if not message:
-            return False
-
-        first_message = message[0]
-        if first_message.get("type") != "text":
+        # 使用未去除空白的原始文本，前导空白的消息不视为命令
+        content = broadcast_info.first_data.get("text") or ""
+        if not content:
             return False
 
-        content = first_message.get("data", {}).get("text", "")
-        command_prefix = self.config.get("GUGUBot", {}).get("command_prefix", "#")
+        self._ensure_config_cache()
 
-        if not content.startswith(command_prefix):
+        if not content.startswith(self._command_prefix):
             return False
 
-        group_admin = self.config.get_keys(["GUGUBot", "group_admin"], False)
-        if group_admin and not broadcast_info.is_admin:
+        if self._group_admin and not broadcast_info.is_admin:
             return False
 
         return True
@@ -149,21 +188,27 @@ class BasicSystem:
         target = {target_source: broadcast_info.event_sub_type}
 
         # 检查是否是 bridge 回复（receiver_source 是 Bridge，但原始来源不是 Bridge）
-        bridge_name = self.config.get_keys(
-            ["connector", "minecraft_bridge", "source_name"],
-            "Bridge"
-        )
+        self._ensure_config_cache()
+        if self._bridge_name is None:
+            self._bridge_name = self.config.get_keys(
+                ["connector", "minecraft_bridge", "source_name"],
+                "Bridge"
+            )
+        bridge_name = self._bridge_name
 
         if broadcast_info.receiver_source == bridge_name \
             and not broadcast_info.source.is_from(bridge_name):
             # 如果 receiver_source 是 Bridge，但原始来源不是 Bridge, 则将 target 设置为 source
             target[broadcast_info.receiver_source] = broadcast_info.event_sub_type
 
+        # 机器人名称随风格和 MCDR 语言变化，每次回复重新翻译
+        bot_name = self.system_manager.server.tr("gugubot.bot_name")
+
         respond = ProcessedInfo(
             processed_message=message,
             _source=broadcast_info.source,  # 传递完整的 Source 对象
             source_id=broadcast_info.source_id,
-            sender=self.system_manager.server.tr("gugubot.bot_name"),
+            sender=bot_name,
             sender_id=None,
             raw=broadcast_info.raw,
             server=broadcast_info.server,
@@ -174,6 +219,7 @@ class BasicSystem:
 
         # 使用当前接收来源或原始来源
         receiver_source = broadcast_info.receiver_source or origin_source
+        # 回复直接发送，不进入批次：处理器可能先回复进度再执行耗时操作
         await self.system_manager.connector_manager.broadcast_processed_info(
             respond,
             include=[receiver_source]
@@ -211,12 +257,11 @@ class BasicSystem:
         if not broadcast_info.is_admin:
             return False
 
-        command = broadcast_info.message[0].get("data", {}).get("text", "")
-        command_prefix = self.config.get("GUGUBot", {}).get("command_prefix", "#")
+        # is_command 已保证消息以命令前缀开头
+        command = broadcast_info.first_data.get("text") or ""
+        command = command[len(self._command_prefix):].strip()
         system_name = self.get_tr("name")
 
-        command = command.replace(command_prefix, "", 1).strip()
-
         if not command.startswith(system_name):
             return False
 
@@ -249,3 +294,4 @@ class BasicSystem:
             if self.name in system_config:
                 system_config[self.name]["enable"] = self.enable
                 self.config.save()
+                self.invalidate_config_cache()
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 
-from typing import Optional
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
 
 from gugubot.builder import MessageBuilder
 from gugubot.config import BotConfig
@@ -8,6 +9,14 @@ from gugubot.logic.system.basic_system import BasicSystem
 from gugubot.utils.types import BroadcastInfo
 
 
+# 玩家绑定状态查询结果的缓存时间（秒）
+PLAYER_CACHE_TTL = 30
+# 同一用户两次提醒的默认最小间隔（秒），对应配置 system.bound_notice.notice_interval
+DEFAULT_NOTICE_INTERVAL = 600
+# 缓存字典达到该大小时清理过期记录
+CACHE_PRUNE_SIZE = 1024
+
+
 class BoundNoticeSystem(BasicSystem):
     """绑定提醒系统，用于提醒未绑定的玩家进行账号绑定。
 
@@ -17,9 +26,20 @@ class BoundNoticeSystem(BasicSystem):
 
     def __init__(self, config: Optional[BotConfig] = None) -> None:
         """初始化绑定提醒系统。"""
+        self._notice_interval: float = DEFAULT_NOTICE_INTERVAL
         super().__init__("bound_notice", enable=False, config=config)
         self.bound_system = None
 
+        # (sender_id, platform) -> (查询时间, 是否已绑定)
+        self._player_cache: Dict[Tuple[Any, str], Tuple[float, bool]] = {}
+        self._player_cache_version: Optional[int] = None
+        # (sender_id, platform) -> 上次发送提醒的时间
+        self._notice_sent_at: Dict[Tuple[Any, str], float] = {}
+
+        # 提醒文本段缓存，配置或风格变化后重新生成
+        self._notice_text_seg: Optional[dict] = None
+        self._notice_text_key: Optional[tuple] = None
+
     def initialize(self) -> None:
         """初始化系统，加载配置等"""
         self.logger.debug("绑定提醒系统已初始化")
@@ -28,6 +48,86 @@ class BoundNoticeSystem(BasicSystem):
         """设置绑定系统引用，用于访问玩家管理器"""
         self.bound_system = bound_system
 
+    def invalidate_config_cache(self) -> None:
+        """额外缓存提醒间隔。"""
+        super().invalidate_config_cache()
+        if self.config is None:
+            return
+        self._notice_interval = self.config.get_keys(
+            ["system", "bound_notice", "notice_interval"], DEFAULT_NOTICE_INTERVAL
+        ) or 0
+
+    def _is_player_bound(self, key: Tuple[Any, str], now: float) -> bool:
+        """查询玩家是否已绑定，结果缓存 PLAYER_CACHE_TTL 秒。
+
+        玩家数据保存（绑定/解绑）后版本号变化，缓存会被整体清空。
+
+        Parameters
+        ----------
+        key : Tuple[Any, str]
+            (sender_id, platform)
+        now : float
+            当前时间（time.monotonic）
+        """
+        player_manager = self.bound_system.player_manager
+        if self._player_cache_version != player_manager.version:
+            self._player_cache.clear()
+            self._player_cache_version = player_manager.version
+
+        cached = self._player_cache.get(key)
+        if cached is not None and now - cached[0] < PLAYER_CACHE_TTL:
+            return cached[1]
+
+        sender_id, platform = key
+        is_bound = player_manager.get_player(sender_id, platform=platform) is not None
+        if len(self._player_cache) >= CACHE_PRUNE_SIZE:
+            self._player_cache = self._prune_expired(
+                self._player_cache, PLAYER_CACHE_TTL, now, lambda record: record[0]
+            )
+        self._player_cache[key] = (now, is_bound)
+        return is_bound
+
+    def _get_notice_segment(self) -> dict:
+        """获取提醒消息的文本段，配置和风格（含重新加载）未变化时复用。"""
+        style_manager = getattr(self.system_manager, "style_manager", None)
+        cache_key = (
+            self._cfg_version,
+            style_manager.generation if style_manager else None,
+        )
+        if self._notice_text_seg is None or self._notice_text_key != cache_key:
+            notice_msg = self.get_tr(
+                "notice_message",
+                command_prefix=self._command_prefix,
+                bound_name=self.bound_system.get_tr("name"),
+            )
+            self._notice_text_seg = MessageBuilder.text(notice_msg)
+            self._notice_text_key = cache_key
+        return self._notice_text_seg
+
+    @staticmethod
+    def _prune_expired(
+            records: Dict, ttl: float, now: float,
+            get_time: Callable[[Any], float] = lambda record: record,
+    ) -> Dict:
+        """返回只保留未过期记录的新字典，避免缓存无限增长。
+
+        Parameters
+        ----------
+        records : Dict
+            要清理的缓存字典
+        ttl : float
+            记录的有效时间（秒）
+        now : float
+            当前时间（time.monotonic）
+        get_time : Callable[[Any], float]
+            从记录值中取出写入时间
+        """
+        return {
+            key: record
+            for key, record in records.items()
+            if now - get_time(record) < ttl
+        }
+
     async def process_broadcast_info(self, broadcast_info: BroadcastInfo) -> bool:
         """处理接收到的消息。
 
@@ -44,6 +144,10 @@ class BoundNoticeSystem(BasicSystem):
         if not message:
             return False
 
+        # 系统关闭时只有管理员可能发送开启命令，其余消息直接跳过
+        if not self.enable and not broadcast_info.is_admin:
+            return False
+
         # 先检查是否是开启/关闭命令
         if await self.handle_enable_disable(broadcast_info):
             return True
@@ -64,35 +168,36 @@ class BoundNoticeSystem(BasicSystem):
         if broadcast_info.is_admin:
             return False
 
+        self._ensure_config_cache()
+
         # 排除管理群消息
-        if broadcast_info.source_id:
-            admin_group_ids = self.config.get_keys(
-                ["connector", "QQ", "permissions", "admin_group_ids"], []
-            )
-            if str(broadcast_info.source_id) in [
-                str(gid) for gid in admin_group_ids if gid
-            ]:
-                return False
+        source_id = broadcast_info.source_id
+        if source_id and str(source_id) in self._admin_group_ids_set:
+            return False
 
-        # 检查玩家是否在玩家管理器中
-        player = self.bound_system.player_manager.get_player(
-            broadcast_info.sender_id, platform=broadcast_info.source.origin
-        )
+        now = time.monotonic()
+        key = (broadcast_info.sender_id, broadcast_info.source.origin)
+
+        # 提醒间隔内已经提醒过该用户，无需再次查询
+        sent_at = self._notice_sent_at.get(key)
+        if sent_at is not None and now - sent_at < self._notice_interval:
+            return False
 
-        # 如果玩家未绑定，发送提醒消息
-        if not player:
-            command_prefix = self.config.get("GUGUBot", {}).get("command_prefix", "#")
-            # 获取绑定系统的名称
-            bound_name = self.bound_system.get_tr("name")
+        # 检查玩家是否在玩家管理器中
+        if not self._is_player_bound(key, now):
+            # 如果玩家未绑定，发送提醒消息
+            if self._notice_interval > 0:
+                if len(self._notice_sent_at) >= CACHE_PRUNE_SIZE:
+                    self._notice_sent_at = self._prune_expired(
+                        self._notice_sent_at, self._notice_interval, now
+                    )
+                self._notice_sent_at[key] = now
 
-            notice_msg = self.get_tr(
-                "notice_message", command_prefix=command_prefix, bound_name=bound_name
-            )
             await self.reply(
                 broadcast_info,
                 [
                     MessageBuilder.at(broadcast_info.sender_id),
-                    MessageBuilder.text(notice_msg),
+                    self._get_notice_segment(),
                 ],
             )
 
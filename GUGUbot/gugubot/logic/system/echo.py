@@ -43,6 +43,13 @@ class EchoSystem(BasicSystem):
         bool
             是否成功处理了消息
         """
+        if broadcast_info.event_type != "message":
+            return False
+
+        # 系统关闭时只有管理员可能发送开启命令，其余消息直接跳过
+        if not self.enable and not broadcast_info.is_admin:
+            return False
+
         # 先检查是否是开启/关闭命令
         if await self.handle_enable_disable(broadcast_info):
             return True
@@ -50,26 +57,22 @@ class EchoSystem(BasicSystem):
         if not self.enable:
             return False
 
-        # 检查是否是QQ私聊消息，如果是则不广播
-        if broadcast_info.source.is_from("QQ") and broadcast_info.event_sub_type == "private":
-            return False
-
-        # 检查是否是QQ管理群的消息，如果是则不广播
-        if broadcast_info.source.is_from("QQ") and broadcast_info.event_sub_type == "group":
-            admin_group_ids = self.config.get_keys(
-                ["connector", "QQ", "permissions", "admin_group_ids"], []
-            )
-            if broadcast_info.source_id and str(broadcast_info.source_id) in [
-                str(i) for i in admin_group_ids if i
-            ]:
-                # 管理群消息不广播，直接返回False
+        origin = broadcast_info.source.origin
+        if origin == "QQ":
+            sub_type = broadcast_info.event_sub_type
+            # QQ私聊消息不广播
+            if sub_type == "private":
                 return False
 
-        if broadcast_info.event_type != "message":
-            return False
+            # QQ管理群的消息不广播
+            if sub_type == "group":
+                self._ensure_config_cache()
+                source_id = broadcast_info.source_id
+                if source_id and str(source_id) in self._admin_group_ids_set:
+                    return False
 
         # 若消息来源 connector 的 enable_send=False，直接不转发（return），而不是仅从目标里排除
-        source_name = broadcast_info.receiver_source or broadcast_info.source.origin
+        source_name = broadcast_info.receiver_source or origin
         source_connector = self.system_manager.connector_manager.get_connector(source_name)
         if source_connector is not None and not source_connector.enable_send:
             return False
@@ -79,11 +82,9 @@ class EchoSystem(BasicSystem):
             processed_info = self.create_processed_info(broadcast_info)
 
             # 转发到其他平台（排除：来源 connector、enable_receive=False、enable_send=False 的目标）
-            exclude_sources = [source_name]
-            for c in self.system_manager.connector_manager.connectors:
-                if not c.enable_receive:
-                    exclude_sources.append(c.source)
-            await self.system_manager.connector_manager.broadcast_processed_info(
+            connector_manager = self.system_manager.connector_manager
+            exclude_sources = [source_name, *connector_manager.disabled_receive_sources]
+            await connector_manager.queue_processed_info(
                 processed_info, exclude=exclude_sources
             )
 
@@ -1,13 +1,15 @@
 import logging
 import re
 import traceback
-from typing import List, Optional
+from contextlib import nullcontext
+from typing import List, Optional, Set
 
 from mcdreforged.api.types import PluginServerInterface
 
 from gugubot.config import BotConfig
 from gugubot.connector import ConnectorManager
 from gugubot.logic.system.basic_system import BasicSystem
+from gugubot.utils.prefix_machine import PrefixMachine
 from gugubot.utils.types import BroadcastInfo
 
 
@@ -50,6 +52,11 @@ class SystemManager:
         self.connector_manager = connector_manager
         self.config = config
 
+        # 命令前缀树：由各系统 register_prefixes 声明的前缀构建，配置或系统变化后重建
+        self.command_trie: Optional[PrefixMachine[str]] = None
+        self._prefix_systems: Set[str] = set()
+        self._trie_version: Optional[int] = None
+
     def get_system(self, name: str) -> Optional[BasicSystem]:
         for system in self.systems:
             if system.name == name:
@@ -105,6 +112,7 @@ class SystemManager:
             else:
                 self.systems.append(system)
 
+            self.command_trie = None
             self.logger.info(f"已添加并初始化系统: {system.name}")
         except Exception as e:
             error_msg = str(e) + "\n" + traceback.format_exc()
@@ -128,6 +136,7 @@ class SystemManager:
         for system in self.systems:
             if system.name == system_name:
                 self.systems.remove(system)
+                self.command_trie = None
                 self.logger.info(f"已移除系统: {system_name}")
                 return True
         return False
@@ -166,22 +175,79 @@ class SystemManager:
                 s for s in to_systems if not any(re.match(p, s.name) for p in exclude)
             ]
 
+        matched = self._match_prefix_systems(broadcast_info)
+        if matched is not None:
+            # 声明了前缀但本条消息不匹配的系统直接跳过
+            to_systems = [
+                s for s in to_systems
+                if s.name not in self._prefix_systems or s.name in matched
+            ]
+
         system_info = f"广播命令到系统: {to_systems}"
         command_info = f"命令内容: {broadcast_info}"
         debug_msg = system_info + "\n" + command_info
         self.logger.debug(debug_msg)
 
+        # 同一事件内各系统产生的转发合并到一个批次，处理结束后统一发送（回复仍直接发送）
+        batch = self.connector_manager.batch() if self.connector_manager else nullcontext()
+
         # 创建处理任务
         result = False
-        for system in to_systems:
-            result = await self._safe_process_broadcast_info(system, broadcast_info)
+        async with batch:
+            for system in to_systems:
+                result = await self._safe_process_broadcast_info(system, broadcast_info)
 
-            if result:
-                break
+                if result:
+                    break
 
         # 判断是否有系统成功处理了命令
         return result
 
+    def _build_command_trie(self) -> None:
+        """根据各系统声明的前缀重建命令前缀树。"""
+        trie: PrefixMachine[str] = PrefixMachine()
+        prefix_systems: Set[str] = set()
+        for system in self.systems:
+            try:
+                prefixes = system.register_prefixes()
+            except Exception as e:
+                self.logger.error(f"获取系统 {system.name} 的命令前缀失败: {e}")
+                continue
+            if prefixes is None:
+                continue
+            prefix_systems.add(system.name)
+            for prefix in prefixes:
+                if prefix:
+                    trie.add(prefix, system.name)
+
+        self.command_trie = trie
+        self._prefix_systems = prefix_systems
+        self._trie_version = self.config.version if self.config else None
+
+    def _match_prefix_systems(self, broadcast_info: BroadcastInfo) -> Optional[Set[str]]:
+        """找出命令前缀与消息匹配的系统名称。
+
+        Returns
+        -------
+        Optional[Set[str]]
+            匹配到的系统名称集合；非消息事件返回 None，表示不做前缀过滤
+        """
+        if broadcast_info.event_type != "message":
+            return None
+
+        config_version = self.config.version if self.config else None
+        if self.command_trie is None or self._trie_version != config_version:
+            self._build_command_trie()
+
+        if not self._prefix_systems:
+            return None
+
+        text = broadcast_info.first_text
+        if not text:
+            return set()
+
+        return set(self.command_trie.match(text))
+
     async def _safe_process_broadcast_info(
             self, system: BasicSystem, broadcast_info: BroadcastInfo
     ) -> bool:
@@ -2,6 +2,7 @@ from gugubot.utils.config_migrator import migrate_config_v1_to_v2
 from gugubot.utils.help_register import help_msg_register
 from gugubot.utils.message import str_to_array
 from gugubot.utils.player_manager import PlayerManager
+from gugubot.utils.prefix_machine import PrefixMachine
 from gugubot.utils.rcon_manager import RconManager
 from gugubot.utils.style_manager import StyleManager
 from gugubot.utils.update_checker import check_plugin_version
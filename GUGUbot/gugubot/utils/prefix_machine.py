@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+"""前缀匹配工具模块。
+
+该模块提供了 PrefixMachine 类，基于前缀树（trie）一次遍历文本即可找出
+所有作为其前缀的已注册字符串。
+"""
+
+from typing import Any, Dict, Generic, List, TypeVar
+
+T = TypeVar("T")
+
+
+class _Node:
+    __slots__ = ("children", "values")
+
+    def __init__(self) -> None:
+        self.children: Dict[str, "_Node"] = {}
+        self.values: List[Any] = []
+
+
+class PrefixMachine(Generic[T]):
+    """前缀树，用于在 O(len(text)) 内匹配所有已注册前缀。
+
+    Examples
+    --------
+    >>> machine = PrefixMachine()
+    >>> machine.add("#mc", "cross_broadcast")
+    >>> machine.add("#", "general_help")
+    >>> machine.match("#mc hello")
+    ['general_help', 'cross_broadcast']
+    >>> machine.match("hello")
+    []
+    """
+
+    def __init__(self) -> None:
+        self._root = _Node()
+
+    def add(self, prefix: str, value: T) -> None:
+        """注册一个前缀。
+
+        Parameters
+        ----------
+        prefix : str
+            前缀字符串
+        value : T
+            匹配到该前缀时返回的值
+        """
+        node = self._root
+        for char in prefix:
+            child = node.children.get(char)
+            if child is None:
+                child = node.children[char] = _Node()
+            node = child
+        node.values.append(value)
+
+    def match(self, text: str) -> List[T]:
+        """查找所有为 text 前缀的已注册前缀对应的值。
+
+        Parameters
+        ----------
+        text : str
+            要匹配的文本
+
+        Returns
+        -------
+        List[T]
+            匹配到的值，按前缀由短到长排列
+        """
+        node = self._root
+        result: List[T] = list(node.values)
+        for char in text:
+            node = node.children.get(char)
+            if node is None:
+                break
+            result.extend(node.values)
+        return result
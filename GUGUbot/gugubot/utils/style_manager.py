@@ -49,6 +49,8 @@ class StyleManager:
         已加载的所有风格，key 为风格名称，value 为翻译字典
     current_style : Optional[str]
         当前激活的风格名称
+    generation : int
+        风格代数，重新扫描或切换风格时递增，供缓存翻译结果的调用方判断是否过期
     """
 
     def __init__(self, server: PluginServerInterface, config=None):
@@ -66,6 +68,7 @@ class StyleManager:
         self.style_dir = Path(server.get_data_folder()) / "style"
         self.styles: Dict[str, Dict] = {}
         self.current_style: Optional[str] = None
+        self.generation: int = 0
 
         # 冷却时间相关
         self.last_switch_time: float = 0.0
@@ -144,6 +147,7 @@ class StyleManager:
 
         # 清空现有风格
         self.styles.clear()
+        self.generation += 1
 
         # 扫描所有 .yml 文件
         for file_path in self.style_dir.glob("*.yml"):
@@ -295,6 +299,7 @@ class StyleManager:
 
         self.current_style = style_name
         self.last_switch_time = time.time()
+        self.generation += 1
 
         # 注册风格翻译到 MCDR
         self._register_style_to_mcdr(style_name)
@@ -1,4 +1,5 @@
 from dataclasses import dataclass, field
+from functools import cached_property
 from logging import Logger
 from typing import Any, List, Literal, Optional, Union
 
@@ -86,6 +87,30 @@ class BroadcastInfo:
         else:
             self._source = Source(value)
 
+    @cached_property
+    def first_data(self) -> dict:
+        """获取第一个文本消息段的 data 字典（结果会被缓存）。
+
+        Returns
+        -------
+        dict
+            第一个消息段为文本段时返回其 data，否则返回空字典
+        """
+        if not self.message or self.message[0].get("type") != "text":
+            return {}
+        return self.message[0].get("data") or {}
+
+    @cached_property
+    def first_text(self) -> str:
+        """获取第一个文本消息段去除首尾空白后的文本（结果会被缓存）。
+
+        Returns
+        -------
+        str
+            第一个消息段为文本段时返回其文本，否则返回空字符串
+        """
+        return (self.first_data.get("text") or "").strip()
+
     @property
     def receiver_source(self) -> str:
         """获取接收消息的本地 connector 的 source（当前来源）。
@@ -0,0 +1,124 @@
+"""BoundNoticeSystem 模块测试
+
+测试提醒间隔的去重、notice_interval 为 0 时的行为，
+以及玩家数据保存后绑定状态缓存的失效
+"""
+import unittest
+from types import SimpleNamespace
+
+from gugubot.logic.system.bound_notice import BoundNoticeSystem
+from gugubot.utils.types import BroadcastInfo
+
+
+class FakeConfig:
+    """按键路径返回预设值的最小配置对象"""
+
+    version = 0
+
+    def __init__(self, values=None):
+        self.values = values or {}
+
+    def get_keys(self, key, default=None):
+        return self.values.get(tuple(key), default)
+
+
+class FakePlayerManager:
+    """记录查询次数的玩家管理器，version 模拟保存后递增的版本号"""
+
+    def __init__(self):
+        self.version = 0
+        self.bound = set()
+        self.lookups = 0
+
+    def get_player(self, sender_id, platform=None):
+        self.lookups += 1
+        return sender_id if (sender_id, platform) in self.bound else None
+
+
+class FakeBoundSystem:
+    def __init__(self):
+        self.player_manager = FakePlayerManager()
+
+    def get_tr(self, key, **kwargs):
+        return "绑定"
+
+
+class RecordingBoundNoticeSystem(BoundNoticeSystem):
+    """记录提醒而不真正发送的绑定提醒系统"""
+
+    def __init__(self, config):
+        super().__init__(config=config)
+        self.notices = []
+
+    async def reply(self, broadcast_info, message):
+        self.notices.append(broadcast_info.sender_id)
+
+
+def make_message(sender_id="10001"):
+    return BroadcastInfo(
+        event_type="message",
+        event_sub_type="group",
+        message=[{"type": "text", "data": {"text": "hello"}}],
+        raw=None,
+        _source="QQ",
+        source_id="123",
+        sender_id=sender_id,
+    )
+
+
+class TestBoundNoticeSystem(unittest.IsolatedAsyncioTestCase):
+    @classmethod
+    def setUpClass(cls):
+        print("\n** Testing BoundNoticeSystem **")
+
+    def make_system(self, notice_interval=None):
+        values = {("system", "bound_notice", "enable"): True}
+        if notice_interval is not None:
+            values[("system", "bound_notice", "notice_interval")] = notice_interval
+
+        system = RecordingBoundNoticeSystem(FakeConfig(values))
+        system.system_manager = SimpleNamespace(
+            server=SimpleNamespace(tr=lambda key, **kwargs: key),
+            style_manager=None,
+        )
+        system.set_bound_system(FakeBoundSystem())
+        return system
+
+    async def test_repeat_notice_suppressed_within_interval(self):
+        system = self.make_system()
+
+        for _ in range(3):
+            await system.process_broadcast_info(make_message())
+        await system.process_broadcast_info(make_message("10002"))
+
+        self.assertEqual(system.notices, ["10001", "10002"])
+
+    async def test_zero_interval_notices_every_message(self):
+        system = self.make_system(notice_interval=0)
+
+        for _ in range(3):
+            await system.process_broadcast_info(make_message())
+
+        self.assertEqual(system.notices, ["10001", "10001", "10001"])
+
+    async def test_player_manager_save_clears_cached_lookup(self):
+        system = self.make_system(notice_interval=0)
+        player_manager = system.bound_system.player_manager
+
+        await system.process_broadcast_info(make_message())
+        await system.process_broadcast_info(make_message())
+        # TTL 内复用缓存，只查询一次
+        self.assertEqual(player_manager.lookups, 1)
+        self.assertEqual(len(system.notices), 2)
+
+        # 玩家绑定后保存，版本号变化
+        player_manager.bound.add(("10001", "QQ"))
+        player_manager.version += 1
+
+        await system.process_broadcast_info(make_message())
+        self.assertEqual(player_manager.lookups, 2)
+        self.assertEqual(len(system.notices), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
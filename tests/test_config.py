@@ -1,7 +1,7 @@
 import unittest
 
-from gugubot.config.BasicConfig import BasicConfig
-from gugubot.config.BotConfig import BotConfig
+from gugubot.config.basic_config import BasicConfig
+from gugubot.config.bot_config import BotConfig
 
 class TestBasicConfig(unittest.TestCase):
     @classmethod
@@ -54,6 +54,38 @@ class TestBasicConfig(unittest.TestCase):
 
         config.path.unlink()
 
+    def test_get_keys(self):
+        # Test nested lookup by key path
+        config = BasicConfig(default_content={"a": {"b": {"c": 1}, "n": None}, "s": "x"})
+
+        # Hit: leaf and intermediate dict
+        self.assertEqual(config.get_keys(["a", "b", "c"]), 1)
+        self.assertEqual(config.get_keys(["a", "b"]), {"c": 1})
+        self.assertIsNone(config.get_keys(["a", "n"], 5))
+
+        # Miss: default value
+        self.assertIsNone(config.get_keys(["a", "x"]))
+        self.assertEqual(config.get_keys(["a", "x", "c"], [1, 2]), [1, 2])
+
+        # Non-dict intermediate: default value
+        self.assertEqual(config.get_keys(["s", "c"], 3), 3)
+
+        # In-place nested change is seen after save
+        config["a"]["b"]["c"] = 2
+        self.assertEqual(config.get_keys(["a", "b", "c"]), 1)
+        config.save()
+        self.assertEqual(config.get_keys(["a", "b", "c"]), 2)
+
+        # Top-level changes are seen immediately
+        config["k"] = "v"
+        self.assertEqual(config.get_keys(["k"]), "v")
+        config.update({"u": 1})
+        self.assertEqual(config.get_keys(["u"]), 1)
+        config.pop("u")
+        self.assertIsNone(config.get_keys(["u"]))
+
+        config.path.unlink()
+
 class TestBotConfig(unittest.TestCase):
     @classmethod
     def setUpClass(self):
@@ -0,0 +1,161 @@
+"""ConnectorManager 模块测试
+
+测试广播批处理（BroadcastBatcher）的分组、顺序以及关闭后的回退行为，
+以及多个事件循环同时发送时的并发限制
+"""
+import asyncio
+import logging
+import threading
+import unittest
+
+from gugubot.connector.basic_connector import BasicConnector
+from gugubot.connector.connector_manager import ConnectorManager
+from gugubot.utils.types import ProcessedInfo
+
+
+class FakeConfig:
+    """只提供 get_keys 的最小配置对象"""
+
+    def get_keys(self, key, default=None):
+        return default
+
+
+class SlowConnector(BasicConnector):
+    """每次发送都需要一点时间的连接器，用于制造信号量竞争"""
+
+    def __init__(self, source: str, config: FakeConfig) -> None:
+        super().__init__(source=source, config=config)
+        self.sent = 0
+        self._lock = threading.Lock()
+
+    async def connect(self) -> None:
+        pass
+
+    async def disconnect(self) -> None:
+        pass
+
+    async def send_message(self, processed_info: ProcessedInfo) -> None:
+        await asyncio.sleep(0.02)
+        with self._lock:
+            self.sent += 1
+
+    async def on_message(self, raw) -> None:
+        pass
+
+
+class RecordingConnector(BasicConnector):
+    """记录每次发送调用的连接器"""
+
+    def __init__(self, source: str, config: FakeConfig) -> None:
+        super().__init__(source=source, config=config)
+        self.calls = []
+
+    async def connect(self) -> None:
+        pass
+
+    async def disconnect(self) -> None:
+        pass
+
+    async def send_message(self, processed_info: ProcessedInfo) -> None:
+        self.calls.append([processed_info.processed_message[0]["data"]["text"]])
+
+    async def send_many(self, processed_infos) -> None:
+        self.calls.append([i.processed_message[0]["data"]["text"] for i in processed_infos])
+
+    async def on_message(self, raw) -> None:
+        pass
+
+
+def make_info(text: str) -> ProcessedInfo:
+    return ProcessedInfo(processed_message=[{"type": "text", "data": {"text": text}}])
+
+
+class TestBroadcastBatcher(unittest.IsolatedAsyncioTestCase):
+    @classmethod
+    def setUpClass(cls):
+        print("\n** Testing ConnectorManager BroadcastBatcher **")
+
+    async def asyncSetUp(self):
+        config = FakeConfig()
+        self.manager = ConnectorManager(
+            None, config, logger=logging.getLogger("test_connector_manager")
+        )
+        self.qq = RecordingConnector("QQ", config)
+        self.mc = RecordingConnector("Minecraft", config)
+        await self.manager.register_connector(self.qq)
+        await self.manager.register_connector(self.mc)
+
+    async def test_group_by_connector_in_order(self):
+        async with self.manager.batch():
+            await self.manager.queue_processed_info(make_info("a"))
+            await self.manager.queue_processed_info(make_info("b"), include=["QQ"])
+            await self.manager.queue_processed_info(make_info("c"), exclude=["QQ"])
+            # 批次内不应发送
+            self.assertEqual(self.qq.calls, [])
+            self.assertEqual(self.mc.calls, [])
+
+        self.assertEqual(self.qq.calls, [["a", "b"]])
+        self.assertEqual(self.mc.calls, [["a", "c"]])
+
+    async def test_nested_batch_shares_outer(self):
+        async with self.manager.batch():
+            async with self.manager.batch():
+                await self.manager.queue_processed_info(make_info("a"), include=["QQ"])
+            self.assertEqual(self.qq.calls, [])
+            await self.manager.queue_processed_info(make_info("b"), include=["QQ"])
+
+        self.assertEqual(self.qq.calls, [["a", "b"]])
+
+    async def test_without_batch_sends_immediately(self):
+        await self.manager.queue_processed_info(make_info("a"), include=["QQ"])
+        self.assertEqual(self.qq.calls, [["a"]])
+
+    async def test_task_outliving_batch_is_not_lost(self):
+        async def late_reply():
+            await asyncio.sleep(0.05)
+            await self.manager.queue_processed_info(make_info("late"), include=["QQ"])
+
+        async with self.manager.batch():
+            await self.manager.queue_processed_info(make_info("reply"), include=["QQ"])
+            # 任务会复制当前上下文（包括批处理器）
+            task = asyncio.create_task(late_reply())
+
+        await task
+        self.assertEqual(self.qq.calls, [["reply"], ["late"]])
+
+
+class TestSendConcurrency(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        print("\n** Testing ConnectorManager send concurrency **")
+
+    def test_sends_from_multiple_event_loops(self):
+        config = FakeConfig()
+        manager = ConnectorManager(
+            None, config, logger=logging.getLogger("test_connector_manager")
+        )
+        connector = SlowConnector("Bridge", config)
+        asyncio.run(manager.register_connector(connector))
+
+        errors = []
+
+        async def burst():
+            # 超过单个连接器的并发上限，保证信号量上有等待者
+            results = await asyncio.gather(
+                *(manager.broadcast_processed_info(make_info(str(i))) for i in range(20))
+            )
+            errors.extend(r for r in results if r)
+
+        # 与 BridgeConnector 一样，在各自线程中用 asyncio.run 启动新的事件循环
+        threads = [threading.Thread(target=asyncio.run, args=(burst(),)) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, [])
+        self.assertEqual(connector.sent, 60)
+
+
+if __name__ == "__main__":
+    unittest.main()
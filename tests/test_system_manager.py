@@ -0,0 +1,97 @@
+"""SystemManager 模块测试
+
+测试同一事件内回复与转发的发送顺序
+"""
+import asyncio
+import logging
+import unittest
+from types import SimpleNamespace
+
+from gugubot.builder import MessageBuilder
+from gugubot.connector.connector_manager import ConnectorManager
+from gugubot.logic.system.basic_system import BasicSystem
+from gugubot.logic.system.system_manager import SystemManager
+from gugubot.utils.types import BroadcastInfo
+
+from tests.test_connector_manager import FakeConfig, RecordingConnector, make_info
+
+
+class ConfigWithVersion(dict):
+    """带版本号、返回默认值的最小配置对象"""
+
+    version = 0
+
+    def get_keys(self, key, default=None):
+        return default
+
+
+class ProgressSystem(BasicSystem):
+    """先回复进度，再执行耗时操作并直接发送结果，最后回复完成"""
+
+    def __init__(self, connector: RecordingConnector) -> None:
+        super().__init__("progress")
+        self.connector = connector
+
+    async def process_broadcast_info(self, broadcast_info: BroadcastInfo) -> bool:
+        await self.reply(broadcast_info, [MessageBuilder.text("start")])
+        await asyncio.sleep(0.01)
+        # 模拟绕过 ConnectorManager 直接发送的通知
+        await self.connector.send_message(make_info("result"))
+        await self.reply(broadcast_info, [MessageBuilder.text("done")])
+        return False
+
+
+class ForwardSystem(BasicSystem):
+    """像 Echo 一样把消息转发到批次中"""
+
+    def __init__(self) -> None:
+        super().__init__("forward")
+
+    async def process_broadcast_info(self, broadcast_info: BroadcastInfo) -> bool:
+        await self.system_manager.connector_manager.queue_processed_info(
+            make_info("forward"), include=["QQ"]
+        )
+        return True
+
+
+class TestSystemManagerOrdering(unittest.IsolatedAsyncioTestCase):
+    @classmethod
+    def setUpClass(cls):
+        print("\n** Testing SystemManager reply ordering **")
+
+    async def asyncSetUp(self):
+        logger = logging.getLogger("test_system_manager")
+        server = SimpleNamespace(logger=logger, tr=lambda key, **kwargs: "GUGUBot")
+
+        self.connector_manager = ConnectorManager(server, FakeConfig(), logger=logger)
+        self.qq = RecordingConnector("QQ", FakeConfig())
+        await self.connector_manager.register_connector(self.qq)
+
+        self.system_manager = SystemManager(
+            server,
+            logger=logger,
+            connector_manager=self.connector_manager,
+            config=ConfigWithVersion(GUGUBot={}),
+        )
+        self.system_manager.register_system(ProgressSystem(self.qq))
+        self.system_manager.register_system(ForwardSystem())
+
+    async def test_reply_is_sent_before_long_work(self):
+        broadcast_info = BroadcastInfo(
+            event_type="message",
+            event_sub_type="group",
+            message=[MessageBuilder.text("hello")],
+            raw=None,
+            _source="QQ",
+            source_id="123",
+        )
+
+        await self.system_manager.broadcast_command(broadcast_info)
+
+        self.assertEqual(
+            self.qq.calls, [["start"], ["result"], ["done"], ["forward"]]
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()